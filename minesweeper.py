@@ -2,8 +2,14 @@
 Minesweeper game
 """
 
+import functools
+import itertools
 import random
 import string
+import sys
+from dataclasses import dataclass
+from operator import or_
+from pathlib import Path
 
 
 #### CORE GAME FUNCTIONS ####
@@ -19,35 +25,107 @@ NEIGHBOURS_SHIFTS = [
 ]
 
 
-def is_visible(table: list[list[int]], position: tuple[int, int]) -> bool:
+@dataclass
+class Board:
+    """
+    Game table, stored as separate flat masks, where the cell at (x, y)
+    is stored at index y * width + x.
+
+    :param width: int, width of the table
+    :param height: int, height of the table
+    :param mines: bytearray, 1 if there is a mine in the cell, otherwise 0
+    :param counts: bytearray, number of mines around the cell
+    :param visible: bytearray, 1 if the cell is visible to the player, otherwise 0
+    :param neighbours: tuple[tuple[int, ...], ...], indices of the neighbours
+    of each cell, see get_neighbours
+    :param hidden: int, number of hidden cells without mines
+    """
+
+    width: int
+    height: int
+    mines: bytearray
+    counts: bytearray
+    visible: bytearray
+    neighbours: tuple[tuple[int, ...], ...]
+    hidden: int
+
+
+def is_visible(board: Board, position: tuple[int, int]) -> bool:
     """
     Check if the cell at the given position is visible to the player.
 
-    :param table: list[list[int]]
+    :param board: Board
     :param position: tuple[int, int], position in the form of (x, y)
 
     :returns: bool, True if cell is visible
     """
-    if table[position[1]][position[0]] > 0:
-        return True
+    return bool(board.visible[position[1] * board.width + position[0]])
 
-    return False
 
-
-def get_value(table: list[list[int]], position: tuple[int, int]) -> int | None:
+def get_value(board: Board, position: tuple[int, int]) -> int | None:
     """
     Get the value of the cell at the given position.
 
-    :param table: list[list[int]]
+    :param board: Board
     :param position: tuple[int, int], position in the form of (x, y)
 
     :returns: int | None: None if cell is a mine. Int between 0 and 8
     is number of mines around the cell.
     """
-    if table[position[1]][position[0]] == 0:
+    index = position[1] * board.width + position[0]
+    if board.mines[index]:
         return None
 
-    return abs(table[position[1]][position[0]]) - 1
+    return board.counts[index]
+
+
+@functools.lru_cache(maxsize=32)
+def get_neighbours(width: int, height: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Get indices of the neighbours of every cell of the table, so
+    boundaries are checked once per table size instead of on every lookup.
+
+    :param width: int, width of the table
+    :param height: int, height of the table
+    :returns: tuple[tuple[int, ...], ...], indices of the neighbours inside
+    the table, where the cell at (x, y) is stored at index y * width + x
+    """
+    return tuple(
+        tuple(
+            (y + shift_y) * width + x + shift_x
+            for shift_x, shift_y in NEIGHBOURS_SHIFTS
+            if 0 <= x + shift_x < width and 0 <= y + shift_y < height
+        )
+        for y in range(height)
+        for x in range(width)
+    )
+
+
+def count_neighbours(mine_mask: bytes, width: int) -> bytes:
+    """
+    Count mines around every cell of the table.
+
+    The mine mask is packed into a single integer with one byte lane per
+    cell, so each of the neighbour directions is added for the whole table
+    with one shift. Counts never exceed 8, so lanes do not overflow.
+
+    :param mine_mask: bytes, flat table where 1 is a mine and 0 is an empty cell
+    :param width: int, width of the table
+    :returns: bytes, flat table of mines numbers around each cell
+    """
+    size = len(mine_mask)
+    height = size // width
+    lane = 8
+    whole = (1 << (size * lane)) - 1
+    # Drop values that wrap around from the neighbouring row
+    not_first = int.from_bytes((b"\x00" + b"\xff" * (width - 1)) * height, "little")
+    not_last = int.from_bytes((b"\xff" * (width - 1) + b"\x00") * height, "little")
+
+    mines = int.from_bytes(mine_mask, "little")
+    rows = mines + ((mines << lane) & not_first) + ((mines >> lane) & not_last)
+    row_shift = width * lane
+    counts = ((rows + (rows << row_shift) + (rows >> row_shift)) & whole) - mines
+    return counts.to_bytes(size, "little")
 
 
 def create_table(
@@ -56,16 +134,13 @@ def create_table(
     mines_number: int,
     ignore_position: tuple[int, int] | None = None,
     randomizer: random.Random | None = None,
-) -> list[list[int]]:
+) -> Board:
     """
     Create table of the specified size and with randomly placed mines,
     number of which is also specified. You can set specific seed to
     generate mine positions via randomizer parameter.
 
-    Table is a 2D array where each cell (x) is an integer.
-    If x is between 1 and 9, then there are x-1 mines around, and cell is visible.
-    If x is between -9 and -1, then there are -x-1 mines around, and cell is hidden.
-    If x is 0, then there is a mine.
+    All cells of the created table are hidden.
 
     :param width: int, width of the table
     :param height: int, height of the table
@@ -75,25 +150,24 @@ def create_table(
     :param randomizer: random.Random | None, randomizer to generate positions
     of the mines. If None, creates a new instance of random.Random.
 
-    :returns: list[list[int]]], generated table
+    :returns: Board, generated table
 
     :raises: ValueError, if there are more mines than can be placed
     """
     if randomizer is None:
         randomizer = random.Random()
 
-    table = [[-1] * width for _ in range(height)]
-    positions = [(x, y) for y in range(height) for x in range(width)]
+    # Indices of the cells, where the cell at (x, y) is at y * width + x
+    positions = range(width * height)
 
     if ignore_position:
-        if ignore_position in positions:
-            positions.remove(ignore_position)
-
-        for shift_x, shift_y in NEIGHBOURS_SHIFTS:
-            neighbour_x = ignore_position[0] + shift_x
-            neighbour_y = ignore_position[1] + shift_y
-            if (neighbour_x, neighbour_y) in positions:
-                positions.remove((neighbour_x, neighbour_y))
+        ignored = {
+            (ignore_position[1] + shift_y) * width + ignore_position[0] + shift_x
+            for shift_x, shift_y in [(0, 0)] + NEIGHBOURS_SHIFTS
+            if 0 <= ignore_position[0] + shift_x < width
+            and 0 <= ignore_position[1] + shift_y < height
+        }
+        positions = list(itertools.filterfalse(ignored.__contains__, positions))
 
     if len(positions) < mines_number:
         raise ValueError(
@@ -101,208 +175,139 @@ def create_table(
                          ({len(positions)} table size, {mines_number} mines"
         )
 
-    mines_positions = randomizer.sample(positions, mines_number)
-    # Place generated mines
-    for x, y in mines_positions:
-        table[y][x] = 0
-
-        # Iterate over all neighbours
-        for shift_x, shift_y in NEIGHBOURS_SHIFTS:
-            neighbour_x = x + shift_x
-            neighbour_y = y + shift_y
-
-            # Check for boundaries
-            if neighbour_y < 0 or neighbour_y >= height:
-                continue
-            if neighbour_x < 0 or neighbour_x >= width:
-                continue
+    mines = bytearray(width * height)
+    for index in randomizer.sample(positions, mines_number):
+        mines[index] = 1
 
-            # Increase neighbour's number of mines around if there is no mine
-            if table[neighbour_y][neighbour_x] < 0:
-                table[neighbour_y][neighbour_x] -= 1
+    return Board(
+        width,
+        height,
+        mines,
+        bytearray(count_neighbours(mines, width)),
+        bytearray(width * height),
+        get_neighbours(width, height),
+        width * height - mines_number,
+    )
 
-    return table
 
-
-def disclose(
-    table: list[list[int]],
-    position: tuple[int, int],
-    recursive_visited: list[tuple[int, int]] | None = None,
-) -> bool | None:
+def disclose(board: Board, position: tuple[int, int]) -> bool | None:
     """
-    Disclose the cell at the given position.
+    Disclose the cell at the given position. If there are no mines around
+    the cell, its neighbours are disclosed too, spreading over the whole
+    empty area.
 
-    :param table: list[list[int]]
+    :param board: Board
     :param position: tuple[int, int], position in the form of (x, y)
-    :param recursive_visited: list[tuple[tuple[int, int], bool]] | None, list of visited
-    positions in the recursive algorithm
 
     :returns: bool | None, None if the position is already visible.
     False if the player hit a mine, True otherwise.
     """
+    width = board.width
+    height = board.height
+
     # Check for boundaries
     if (
         position[1] < 0
-        or position[1] >= len(table)
+        or position[1] >= height
         or position[0] < 0
-        or position[0] >= len(table[0])
+        or position[0] >= width
     ):
         return None
 
-    if recursive_visited is None:
-        recursive_visited = []
-
-    if position in recursive_visited:
-        return None
-
-    recursive_visited.append(position)
-
     # Check if cell is hidden
-    if is_visible(table, position):
+    if is_visible(board, position):
         return None
 
-    value = get_value(table, position)
-
-    if value is None:
+    if get_value(board, position) is None:
         return False
 
-    table[position[1]][position[0]] = value + 1
+    visible = board.visible
+    counts = board.counts
+    neighbours = board.neighbours
+    # Cells that were already put on the stack
+    queued = bytearray(width * height)
+    index = position[1] * width + position[0]
+    queued[index] = 1
+    stack = [index]
+    disclosed = 0
+    while stack:
+        index = stack.pop()
+
+        # Visible cells are skipped. Mines are never reached here, because
+        # only cells without mines around spread to their neighbours
+        if visible[index]:
+            continue
+
+        visible[index] = 1
+        disclosed += 1
+
+        if counts[index]:
+            continue
 
-    if value == 0:
         # Disclose neighbours
-        for shift_x, shift_y in NEIGHBOURS_SHIFTS:
-            neighbour_x = position[0] + shift_x
-            neighbour_y = position[1] + shift_y
-
-            disclose(table, (neighbour_x, neighbour_y), recursive_visited)
+        for neighbour in neighbours[index]:
+            if not queued[neighbour]:
+                queued[neighbour] = 1
+                stack.append(neighbour)
 
+    board.hidden -= disclosed
     return True
 
 
-def disclose_whole(table: list[list[int]]):
-    """
-    Disclose all cells in the table.
-
-    :param table: list[list[int]]
-    """
-
-    for y, rows in enumerate(table):
-        for x, cell in enumerate(rows):
-            if cell == 0:
-                continue
-
-            table[y][x] = abs(cell)
-
-
-def is_game_active(table: list[list[int]]) -> bool:
+def is_game_active(board: Board) -> bool:
     """
     Check if there are hidden cells without bombs on the table.
 
-    :param table: list[list[int]]
+    :param board: Board
     :returns: bool, True if there are such cells, otherwise False
     """
-    for row in table:
-        for cell in row:
-            if cell < 0:
-                return True
-
-    return False
+    return board.hidden > 0
 
 
 #### GRAPHICS AND INTERACTION GAME FUNCTIONS ####
 
-HELP_TEXT = """
-Welcome to Minesweeper Game!
-The goal of the game is to uncover all cells that do not contain mines.
-Flag cells to mark suspected mines. If you reveal a mine by mistake, 
-the game is over!
-
---------------------------
-     Commands Overview
---------------------------
-
-- start or s [difficulty]
-    Starts a new game with a preset difficulty.
-    Difficulty Levels:
-      easy   - 8x8 grid, 10 mines
-      normal - 16x16 grid, 40 mines
-      hard   - 24x24 grid, 99 mines
-    Example: start easy
-
-- start or s [rows] [cols] [mines]
-    Starts a new game with custom grid dimensions and mine count.
-    Example: start 10 10 20
 
-- display or d
-    Displays the current game field.
-    Example: display
-
-- flag or f [position]
-    Flags a cell you suspect contains a mine.
-    Example: flag B3 or f 3B or f 3 b
-
-- hit or h or disclose or reveal or r [position]
-    Reveals the cell at the specified position.
-    Example: reveal B3 or h 3B or h 3 b
-
-- end or e
-    Ends the current game without determining win/loss.
-    Example: end
-
-- quit or q or exit
-    Quits Minesweeper game entirely.
-    Example: quit
-
-- help or ?
-    Displays this help menu.
-    Example: help
-
---------------------------
-   Position Format
---------------------------
-
-Specify cell positions in one of the following formats:
-   [letter][number]    Example: B3
-   [number][letter]    Example: 3B
-   [letter] [number]   Example: B 3
-   [number] [letter]   Example: 3 B
-
-   The letter represents the column, and the number represents the row.
-   Also the game is case-insensitive, so 3b and 3B are treated as same.
+@functools.cache
+def get_help_text() -> str:
+    """
+    Read help menu text from help.txt, placed next to this file.
+    The file is read only once, on the first call.
 
---------------------------
-   How to Play
---------------------------
+    :returns: str, help menu text
+    """
+    return (Path(__file__).parent / "help.txt").read_text(encoding="utf-8").strip()
 
-1. OBJECTIVE:
-   Uncover all cells that do not contain mines without revealing a mine. 
-   The game ends if you reveal a mine.
 
-2. REVEALING CELLS:
-   Start the game by revealing a cell. If a cell has no adjacent mines,
-   nearby cells will automatically reveal. If a cell displays a number,
-   it indicates how many mines are adjacent to it. Use this info to deduce 
-   safe cells.
+# Cell codes are built as number of mines around the cell, combined with
+# the following bits, and then translated into glyphs via GLYPHS
+HIDDEN_BITS = bytes.maketrans(b"\x00\x01", b"\x10\x00")
+MINE_BITS = bytes.maketrans(b"\x00\x01", b"\x00\x20")
+GLYPHS = b" 12345678" + b"?" * 23 + b"X" * 224
+# Maps column letter to its index
+COLUMNS = {letter: index for index, letter in enumerate(string.ascii_lowercase)}
 
-3. FLAGGING MINES:
-   Use the 'flag' command to mark cells where you suspect a mine. This 
-   helps keep track of possible mine locations.
 
-4. WINNING AND LOSING:
-   WIN by revealing all non-mine cells.
-   LOSE if you reveal a cell containing a mine.
+@functools.lru_cache(maxsize=32)
+def get_frame(width: int, height: int) -> bytes:
+    """
+    Render the parts of the table text that do not depend on the cells:
+    column letters, row numbers and separators. Cells are left as spaces.
 
-5. ENDING AND EXITING:
-   Use 'end' to abandon the current game.
-   Use 'quit' to leave Minesweeper entirely.
+    :param width: int, width of the table
+    :param height: int, height of the table
+    :returns: bytes, table frame in the text format
+    """
+    column_size = 2 if height >= 10 else 1
+    lines = [" " * (column_size + 1) + " ".join(string.ascii_uppercase[:width])]
+    for y in range(height):
+        lines.append(f"{y + 1: >{column_size}}" + " " * (2 * width))
 
-Good luck!
-""".strip()
+    return "\n".join(lines).encode()
 
 
 def render_table(
-    table: list[list[int]] | None = None,
-    flags: list[tuple[int, int]] | None = None,
+    board: Board | None = None,
+    flags: set[int] | None = None,
     view_mines: bool = False,
     width: int = 0,
     height: int = 0,
@@ -310,56 +315,46 @@ def render_table(
     """
     Render given table to the text.
 
-    :param table: list[list[int]] | None: table or None if to render an empty table
-    :param flags: list[tuple[int, int]] | None: positions of the flags on the table
-    :param view_mines: bool, if True, views mines as "X"
-    :param width: int, width of the empty table, used only when table is None
-    :param height: int, height of the empty table, used only when table is None
+    :param board: Board | None: table or None if to render an empty table
+    :param flags: set[int] | None: indices of the flags on the table, where
+    the cell at (x, y) is at y * width + x
+    :param view_mines: bool, if True, views all cells as disclosed and mines as "X"
+    :param width: int, width of the empty table, used only when board is None
+    :param height: int, height of the empty table, used only when board is None
     :returns: str, table in the text format
     """
-    if table:
-        height = len(table)
-        width = len(table[0])
+    if board:
+        width, height = board.width, board.height
     if not flags:
-        flags = []
+        flags = set()
+
+    if board:
+        if view_mines:
+            # All cells are shown, as if the whole table was disclosed
+            bits = board.mines.translate(MINE_BITS)
+        else:
+            bits = board.visible.translate(HIDDEN_BITS)
+        glyphs = bytearray(bytes(map(or_, board.counts, bits)).translate(GLYPHS))
+    else:
+        glyphs = bytearray(b"?" * (width * height))
+
+    # Flags are shown only on hidden cells
+    for index in flags:
+        if glyphs[index] == ord("?"):
+            glyphs[index] = ord("F")
 
     column_size = 2 if height >= 10 else 1
-    lines = [" " * (column_size + 1) + " ".join(string.ascii_uppercase[:width])]
+    # Line break, row number, space and glyphs separated by spaces
+    row_size = column_size + 2 * width + 1
+
+    text = bytearray(get_frame(width, height))
+    # Header is as long as a row without the line break
+    start = row_size - 1 + column_size + 2
     for y in range(height):
-        # line = ""
-        line = [f"{y + 1: >{column_size}}"]
-        for x in range(width):
-            if table:
-                cell = (
-                    is_visible(table, (x, y)),
-                    get_value(table, (x, y)),
-                    (x, y) in flags,
-                )
-            else:
-                cell = (x, y) in flags
-
-            match cell:
-                # If (mine) and (view_mines)
-                case (False, None, _) if view_mines:
-                    line.append("X")
-                # If (no table and not flagged) or (not visible and not flagged)
-                case False | (False, _, False):
-                    line.append("?")
-                # If (no table and flagged) or (not visible and flagged)
-                case True | (False, _, True):
-                    line.append("F")
-                # If (visible and value is 0)
-                case (True, 0, _):
-                    line.append(" ")
-                # If (visible)
-                case (True, value, _):
-                    line.append(str(value))
-                case _:
-                    raise ValueError(f"Unparsed cell occured: {cell}")
-
-        lines.append(" ".join(line))
-
-    return "\n".join(lines)
+        text[start : start + 2 * width : 2] = glyphs[y * width : (y + 1) * width]
+        start += row_size
+
+    return text.decode()
 
 
 def read_command() -> str:
@@ -389,64 +384,60 @@ def parse_position(argument: list[str]) -> tuple[int, int] | None:
         )
         return None
 
-    if len(argument) == 2:
-        argument = argument[0] + argument[1]
-    else:
-        argument = argument[0]
+    argument = "".join(argument)
 
-    if argument[0] in string.ascii_lowercase:
+    if argument[0] in COLUMNS:
         row = argument[1:]
-        col = argument[0]
+        col = COLUMNS[argument[0]]
     else:
         row = argument[:-1]
-        col = argument[-1]
+        col = COLUMNS.get(argument[-1])
 
-    try:
-        row = int(row) - 1
-        col = string.ascii_lowercase.index(col)
-    except ValueError:
+    if col is None or not row.isdecimal():
         print(
             "You have to specify column as a latin letter and row"
             "as an integer after this command"
         )
         return None
 
-    return (col, row)
+    return (col, int(row) - 1)
 
 
 def print_table(
-    game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    game: tuple[Board | None, int, int, int, set[int]] | None,
     view_mines: bool = False,
+    message: str = "",
 ):
     """
-    Print current game's table to stdout.
+    Print current game's table to stdout. Everything is written at once.
 
-    :param game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :param game: tuple[Board | None, int, int, int, set[int]] | None,
     current game data
-    :param view_mines: bool, if True, views mines as "X"
+    :param view_mines: bool, if True, views all cells as disclosed and mines as "X"
+    :param message: str, lines printed before the table
     """
     if not game:
         return
 
-    print()
-    print(render_table(game[0], game[4], view_mines, game[1], game[2]))
+    table = render_table(game[0], game[4], view_mines, game[1], game[2])
+    sys.stdout.write(f"{message}\n{table}\n")
 
 
 def command_start(
     width: int | str,
     height: int | str,
     mines_number: int | str,
-    game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
-) -> tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None:
+    game: tuple[Board | None, int, int, int, set[int]] | None,
+) -> tuple[Board | None, int, int, int, set[int]] | None:
     """
     Command: start new game.
 
     :param width: int | str, table width, automaticall converts str to int
     :param height: int | str, table height, automaticall converts str to int
     :param mines_number: int | str, mines number, automaticall converts str to int
-    :param game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :param game: tuple[Board | None, int, int, int, set[int]] | None,
     old game data
-    :returns: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :returns: tuple[Board | None, int, int, int, set[int]] | None,
     new game data if updated, otherwise returns same as inptuted
     """
     try:
@@ -465,27 +456,27 @@ def command_start(
         print(f"Mines number has to be between 1 and {width*height - 9}")
         return game
 
-    game = (None, width, height, mines_number, [])
+    game = (None, width, height, mines_number, set())
 
-    print(f"Game started. There are {mines_number} mines.")
-    print("Good luck!")
-    print_table(game)
+    print_table(
+        game, message=f"Game started. There are {mines_number} mines.\nGood luck!\n"
+    )
     return game
 
 
 def command_flag(
     argument: list[str],
-    game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
-) -> tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None:
+    game: tuple[Board | None, int, int, int, set[int]] | None,
+) -> tuple[Board | None, int, int, int, set[int]] | None:
     """
     Command: flag or unflag cell.
 
     :param argument: list[str], two or one strings, that has integer and
     latin letter
     :param argument: list[str],
-    :param game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :param game: tuple[Board | None, int, int, int, set[int]] | None,
     old game data
-    :returns: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :returns: tuple[Board | None, int, int, int, set[int]] | None,
     new game data if updated, otherwise returns same as inptuted
     """
     if not game:
@@ -499,37 +490,34 @@ def command_flag(
     # Check for boundaries
     if (
         position[1] < 0
-        or position[1] >= game[1]
+        or position[1] >= game[2]
         or position[0] < 0
-        or position[0] >= game[2]
+        or position[0] >= game[1]
     ):
         print("Position is already visible or is out of range.")
         return game
 
-    if is_visible(game[0], position):
+    if game[0] and is_visible(game[0], position):
         print("Position is already visible or is out of range.")
         return game
 
-    if position in game[4]:
-        game[4].remove(position)
-    else:
-        game[4].append(position)
+    game[4].symmetric_difference_update({position[1] * game[1] + position[0]})
     print_table(game)
     return game
 
 
 def command_hit(
     argument: list[str],
-    game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
-) -> tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None:
+    game: tuple[Board | None, int, int, int, set[int]] | None,
+) -> tuple[Board | None, int, int, int, set[int]] | None:
     """
     Command: hit cell.
 
     :param argument: list[str], two or one strings, that has integer and
     latin letter
-    :param game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :param game: tuple[Board | None, int, int, int, set[int]] | None,
     old game data
-    :returns: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :returns: tuple[Board | None, int, int, int, set[int]] | None,
     new game data if updated, otherwise returns same as inptuted
     """
     if not game:
@@ -549,7 +537,6 @@ def command_hit(
             print("Position is already visible or is out of range.")
         case False:
             print("Unfortunately, you hit a mine.")
-            disclose_whole(game[0])
             print_table(game, True)
             game = None
         case True if is_game_active(game[0]):
@@ -564,15 +551,15 @@ def command_hit(
 
 def parse_command(
     command: str,
-    game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
-) -> tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None:
+    game: tuple[Board | None, int, int, int, set[int]] | None,
+) -> tuple[Board | None, int, int, int, set[int]] | None:
     """
     Parse command inputted by the player.
 
     :param command: str, player-inputted command
-    :param game: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :param game: tuple[Board | None, int, int, int, set[int]] | None,
     old game data
-    :returns: tuple[list[list[int]] | None, int, int, int, list[tuple[int, int]]] | None,
+    :returns: tuple[Board | None, int, int, int, set[int]] | None,
     new game data if updated, otherwise returns same as inptuted
     """
     match command.split():
@@ -596,7 +583,6 @@ def parse_command(
                 print("Game is not started.")
                 return game
 
-            disclose_whole(game[0])
             print_table(game, True)
             game = None
         case ["display"] | ["d"]:
@@ -606,7 +592,7 @@ def parse_command(
 
             print_table(game)
         case ["help"] | ["?"]:
-            print(HELP_TEXT)
+            print(get_help_text())
         case []:
             pass
         case (